@@ -4,11 +4,13 @@ MazeMaster - A retro-style maze game
 Player (red square) must escape mazes while avoiding orange adversaries
 """
 
+import numpy as np
 import pygame
 import random
 import math
 import sys
-from enum import Enum
+from collections import defaultdict, deque
+from functools import lru_cache
 from typing import List, Tuple, Optional
 
 # Initialize Pygame
@@ -20,6 +22,13 @@ WINDOW_HEIGHT = 600
 CELL_SIZE = 20
 MAZE_WIDTH = 35
 MAZE_HEIGHT = 25
+# Offsets around the maze center in order of increasing (Chebyshev) distance
+CENTER_RADIUS = min(MAZE_WIDTH, MAZE_HEIGHT) // 2 - 1
+CENTER_OFFSETS = sorted(((dx, dy)
+                         for dx in range(-CENTER_RADIUS, CENTER_RADIUS + 1)
+                         for dy in range(-CENTER_RADIUS, CENTER_RADIUS + 1)),
+                        key=lambda offset: max(abs(offset[0]), abs(offset[1])))
+UNREACHABLE = np.iinfo(np.int32).max  # Distance-field value for walls
 
 # Colors (retro palette)
 BLACK = (0, 0, 0)
@@ -32,81 +41,155 @@ YELLOW = (255, 255, 0)
 GRAY = (128, 128, 128)
 DARK_GRAY = (64, 64, 64)
 
-class Direction(Enum):
-    UP = (0, -1)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-    RIGHT = (1, 0)
+# Directions as (dx, dy) unit vectors
+Direction = Tuple[int, int]
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
 
-class GameState(Enum):
-    MENU = 1
-    PLAYING = 2
-    GAME_OVER = 3
-    LEVEL_COMPLETE = 4
+# Held-key bindings, checked in order of priority
+MOVE_KEYS = (
+    (pygame.K_UP, UP),
+    (pygame.K_DOWN, DOWN),
+    (pygame.K_LEFT, LEFT),
+    (pygame.K_RIGHT, RIGHT),
+)
+GUN_KEYS = (
+    (pygame.K_a, LEFT),
+    (pygame.K_d, RIGHT),
+    (pygame.K_w, UP),
+    (pygame.K_s, DOWN),
+)
+
+CARVE_DIRECTIONS = ((0, 2), (2, 0), (0, -2), (-2, 0))  # Maze generation steps
+NEIGHBOR_OFFSETS = np.array(DIRECTIONS, dtype=np.int32)
+
+# Game states
+MENU, PLAYING, GAME_OVER, LEVEL_COMPLETE = range(1, 5)
+
+@lru_cache(maxsize=256)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render antialiased text, reusing the surface while the text is unchanged"""
+    return font.render(text, True, color)
 
 class Maze:
+    __slots__ = ('width', 'height', 'grid', 'surface')
+    
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.grid = [[1 for _ in range(width)] for _ in range(height)]
+        # Grid is padded with a permanent 1-cell wall border, so cell (x, y)
+        # lives at grid[y + 1, x + 1] and lookups one step outside the maze
+        # need no bounds checks
+        self.grid = np.ones((height + 2, width + 2), dtype=np.uint8)
         self.generate_maze()
+        self.surface = self.render()
     
     def generate_maze(self):
         """Generate maze using recursive backtracking algorithm"""
         # Start with all walls
-        self.grid = [[1 for _ in range(self.width)] for _ in range(self.height)]
-        
-        # Create paths
-        stack = [(1, 1)]
-        self.grid[1][1] = 0
-        
-        while stack:
-            current_x, current_y = stack[-1]
-            neighbors = []
+        self.grid.fill(1)
+        cells = self.grid[1:-1, 1:-1]  # View of the maze without the border
+        max_x, max_y = self.width - 1, self.height - 1
+        
+        # Create paths; every carved cell is pushed at most once, so the
+        # stack can be preallocated
+        stack = np.empty((self.width * self.height, 2), dtype=np.int32)
+        stack[0] = (1, 1)
+        top = 1
+        cells[1, 1] = 0
+        neighbors = [None] * len(CARVE_DIRECTIONS)
+        
+        current_x, current_y = 1, 1
+        while top:
+            count = 0
             
             # Check all four directions
-            for dx, dy in [(0, 2), (2, 0), (0, -2), (-2, 0)]:
+            for dx, dy in CARVE_DIRECTIONS:
                 nx, ny = current_x + dx, current_y + dy
-                if (0 < nx < self.width - 1 and 0 < ny < self.height - 1 and 
-                    self.grid[ny][nx] == 1):
-                    neighbors.append((nx, ny))
+                if 0 < nx < max_x and 0 < ny < max_y and cells[ny, nx]:
+                    neighbors[count] = (nx, ny)
+                    count += 1
             
-            if neighbors:
+            if count:
                 # Choose random neighbor
-                next_x, next_y = random.choice(neighbors)
+                next_x, next_y = neighbors[random.randrange(count)]
                 # Remove wall between current and next
-                wall_x = current_x + (next_x - current_x) // 2
-                wall_y = current_y + (next_y - current_y) // 2
-                self.grid[wall_y][wall_x] = 0
-                self.grid[next_y][next_x] = 0
-                stack.append((next_x, next_y))
+                cells[(current_y + next_y) // 2, (current_x + next_x) // 2] = 0
+                cells[next_y, next_x] = 0
+                stack[top] = (next_x, next_y)
+                top += 1
+                current_x, current_y = next_x, next_y
             else:
-                stack.pop()
+                # Backtrack
+                top -= 1
+                if top:
+                    current_x, current_y = stack[top - 1].tolist()
         
         # Ensure exit is accessible
-        self.grid[self.height - 2][self.width - 2] = 0
-        self.grid[self.height - 2][self.width - 3] = 0
+        cells[self.height - 2, self.width - 2] = 0
+        cells[self.height - 2, self.width - 3] = 0
+    
+    def render(self) -> pygame.Surface:
+        """Pre-render the static maze (walls, floors and exit) into a surface"""
+        walls = self.grid[1:-1, 1:-1, None] == 1
+        colors = np.where(walls, np.array(WHITE, dtype=np.uint8),
+                          np.array(DARK_GRAY, dtype=np.uint8))
+        colors[self.height - 2, self.width - 2] = GREEN  # Exit
+        
+        # Upscale each cell to CELL_SIZE x CELL_SIZE pixels; surfarray is
+        # indexed (x, y) so swap the row/column axes
+        pixels = colors.repeat(CELL_SIZE, axis=0).repeat(CELL_SIZE, axis=1)
+        pixels = pixels.transpose(1, 0, 2)
+        
+        surface = pygame.Surface((self.width * CELL_SIZE, self.height * CELL_SIZE)).convert()
+        pygame.surfarray.blit_array(surface, pixels)
+        return surface
+    
+    def distance_field(self, x: int, y: int) -> np.ndarray:
+        """Breadth-first step distance from (x, y) to every cell of the padded grid"""
+        stride = self.width + 2
+        walls = self.grid.ravel().tolist()
+        dist = [UNREACHABLE] * len(walls)
+        start = (y + 1) * stride + x + 1
+        dist[start] = 0
+        queue = deque([start])
+        offsets = (-stride, stride, -1, 1)
+        
+        while queue:
+            cell = queue.popleft()
+            next_dist = dist[cell] + 1
+            for offset in offsets:
+                neighbor = cell + offset
+                if not walls[neighbor] and dist[neighbor] == UNREACHABLE:
+                    dist[neighbor] = next_dist
+                    queue.append(neighbor)
+        
+        return np.array(dist, dtype=np.int32).reshape(self.grid.shape)
     
     def is_wall(self, x: int, y: int) -> bool:
-        if x < 0 or x >= self.width or y < 0 or y >= self.height:
-            return True
-        return self.grid[y][x] == 1
+        # The wall border covers positions up to one cell outside the maze
+        return self.grid[y + 1, x + 1] == 1
     
     def is_valid_position(self, x: int, y: int) -> bool:
-        return not self.is_wall(x, y)
+        return self.grid[y + 1, x + 1] == 0
 
 class Player:
+    __slots__ = ('x', 'y', 'gun_direction', 'shoot_cooldown', 'move_cooldown', 'move_speed')
+    
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
-        self.gun_direction = Direction.RIGHT  # Gun orientation separate from movement
+        self.gun_direction = RIGHT  # Gun orientation separate from movement
         self.shoot_cooldown = 0
         self.move_cooldown = 0  # Add movement cooldown for smooth continuous movement
         self.move_speed = 6  # Frames between moves (lower = faster)
     
     def move_to_nearest_tunnel(self, direction: Direction, maze: Maze) -> bool:
         """Move to the immediate next tunnel in the given direction (no wall jumping)"""
-        dx, dy = direction.value
+        dx, dy = direction
         
         # Check the immediate next position in the chosen direction
         new_x = self.x + dx
@@ -128,11 +211,11 @@ class Player:
         """Rotate gun left or right"""
         self.gun_direction = direction
     
-    def shoot(self) -> 'Laser':
+    def shoot(self, maze: Maze) -> 'Laser':
         if self.shoot_cooldown <= 0:
             self.shoot_cooldown = 15  # Reduced cooldown for better gameplay
-            dx, dy = self.gun_direction.value
-            return Laser(self.x, self.y, dx, dy)
+            dx, dy = self.gun_direction
+            return Laser(self.x, self.y, dx, dy, maze)
         return None
     
     def update(self):
@@ -142,82 +225,101 @@ class Player:
             self.move_cooldown -= 1
 
 class Adversary:
+    __slots__ = ('x', 'y', 'speed', 'move_interval', 'move_timer', 'path')
+    
     def __init__(self, x: int, y: int, speed: float = 1.0):
         self.x = x
         self.y = y
         self.speed = speed
+        self.move_interval = max(1, int(60 / speed))  # Frames between moves
         self.move_timer = 0
         self.path = []
     
-    def update(self, player: Player, maze: Maze):
+    def update(self) -> bool:
+        """Advance the move timer; returns True when the adversary is due to move"""
         self.move_timer += 1
-        move_interval = max(1, int(60 / self.speed))  # Adjust speed
         
-        if self.move_timer >= move_interval:
+        if self.move_timer >= self.move_interval:
             self.move_timer = 0
-            self.move_towards_player(player, maze)
-    
-    def move_towards_player(self, player: Player, maze: Maze):
-        """Simple AI to move towards player"""
-        dx = player.x - self.x
-        dy = player.y - self.y
-        
-        # Prioritize movement direction
-        moves = []
-        if abs(dx) > abs(dy):
-            if dx > 0:
-                moves.append((1, 0))
-            else:
-                moves.append((-1, 0))
-            if dy > 0:
-                moves.append((0, 1))
-            else:
-                moves.append((0, -1))
-        else:
-            if dy > 0:
-                moves.append((0, 1))
-            else:
-                moves.append((0, -1))
-            if dx > 0:
-                moves.append((1, 0))
-            else:
-                moves.append((-1, 0))
-        
-        # Try moves in order of preference
-        for move_dx, move_dy in moves:
-            new_x, new_y = self.x + move_dx, self.y + move_dy
-            if maze.is_valid_position(new_x, new_y):
-                self.x, self.y = new_x, new_y
-                break
+            return True
+        return False
+    
+    @staticmethod
+    def move_towards_player(adversaries: List['Adversary'], dist_field: np.ndarray):
+        """Step each adversary to the neighbouring cell closest to the player
+        
+        dist_field is the player's distance field from Maze.distance_field, so
+        this follows a shortest path through the maze. All given adversaries
+        are moved in one batch.
+        """
+        positions = np.array([(adversary.x, adversary.y) for adversary in adversaries],
+                             dtype=np.int32)
+        # Grid is padded by one wall cell
+        candidates = positions[:, None, :] + NEIGHBOR_OFFSETS[None, :, :] + 1
+        dists = dist_field[candidates[..., 1], candidates[..., 0]]
+        best = dists.argmin(axis=1)
+        rows = np.arange(len(adversaries))
+        
+        # Stay put if no neighbour is closer (walls are UNREACHABLE)
+        closer = dists[rows, best] < dist_field[positions[:, 1] + 1, positions[:, 0] + 1]
+        new_positions = np.where(closer[:, None], candidates[rows, best] - 1, positions)
+        
+        for adversary, (x, y) in zip(adversaries, new_positions.tolist()):
+            adversary.x, adversary.y = x, y
 
 class Laser:
-    def __init__(self, x: int, y: int, dx: int, dy: int):
+    __slots__ = ('start_x', 'start_y', 'x', 'y', 'dx', 'dy', 'step', 'active',
+                 'max_trail_length', 'end_step')
+    
+    def __init__(self, x: int, y: int, dx: int, dy: int, maze: Maze):
+        self.start_x = x
+        self.start_y = y
         self.x = float(x)
         self.y = float(y)
         self.dx = dx * 0.5  # Laser speed
         self.dy = dy * 0.5
+        self.step = 0  # Frames travelled
         self.active = True
-        self.trail = []  # For visual trail effect
         self.max_trail_length = 8
+        
+        # Lasers fly in a straight line, so the wall they hit is known up
+        # front: raycast along the row/column (the padded border guarantees
+        # a wall) instead of testing the grid every frame
+        grid_x, grid_y = x + 1, y + 1
+        if dx > 0:
+            ray = maze.grid[grid_y, grid_x + 1:]
+        elif dx < 0:
+            ray = maze.grid[grid_y, grid_x - 1::-1]
+        elif dy > 0:
+            ray = maze.grid[grid_y + 1:, grid_x]
+        else:
+            ray = maze.grid[grid_y - 1::-1, grid_x]
+        distance = int(ray.argmax()) + 1
+        # Positions truncate to cells, so moving in the negative direction
+        # the laser enters the wall cell half a cell (one step) sooner
+        self.end_step = 2 * distance if dx + dy > 0 else 2 * distance - 1
     
-    def update(self, maze: Maze):
+    def update(self):
         if not self.active:
             return
         
-        # Add current position to trail
-        self.trail.append((int(self.x), int(self.y)))
-        if len(self.trail) > self.max_trail_length:
-            self.trail.pop(0)
-        
         # Move laser
-        self.x += self.dx
-        self.y += self.dy
+        self.step += 1
+        self.x = self.start_x + self.dx * self.step
+        self.y = self.start_y + self.dy * self.step
         
         # Check if laser hits wall
-        if maze.is_wall(int(self.x), int(self.y)):
+        if self.step >= self.end_step:
             self.active = False
+    
+    def trail(self) -> List[Tuple[int, int]]:
+        """Cells of the last few positions, for the visual trail effect"""
+        return [(int(self.start_x + self.dx * step), int(self.start_y + self.dy * step))
+                for step in range(max(0, self.step - self.max_trail_length), self.step)]
 
 class Explosion:
+    __slots__ = ('x', 'y', 'timer', 'max_timer')
+    
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -244,7 +346,20 @@ class Game:
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
-        self.state = GameState.MENU
+        # Screen state last presented by draw(), and the rects drawn over
+        # the background in that frame
+        self._drawn_state = None
+        self._dirty_rects = []
+        
+        # Per-frame rect fills grouped by colour (see draw_game)
+        self._frame_fills = defaultdict(list)
+        
+        # Semi-transparent overlay for the game over / level complete screens
+        self.overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.overlay.set_alpha(128)
+        self.overlay.fill(BLACK)
+        
+        self.state = MENU
         self.level = 1
         self.score = 0
         
@@ -254,22 +369,21 @@ class Game:
         """Initialize/reset level"""
         self.maze = Maze(MAZE_WIDTH, MAZE_HEIGHT)
         
-        # Place player in center
+        # Static background (maze centered, space above for UI) used for full
+        # redraws and to erase sprites between frames
+        self.maze_offset = ((WINDOW_WIDTH - self.maze.width * CELL_SIZE) // 2, 50)
+        self.background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self.background.fill(BLACK)
+        self.background.blit(self.maze.surface, self.maze_offset)
+        self._drawn_state = None  # Force a full redraw
+        
+        # Place player at the valid position nearest to the center
         center_x, center_y = MAZE_WIDTH // 2, MAZE_HEIGHT // 2
-        # Find nearest valid position to center
-        for radius in range(min(MAZE_WIDTH, MAZE_HEIGHT) // 2):
-            for dx in range(-radius, radius + 1):
-                for dy in range(-radius, radius + 1):
-                    x, y = center_x + dx, center_y + dy
-                    if self.maze.is_valid_position(x, y):
-                        self.player = Player(x, y)
-                        break
-                else:
-                    continue
+        for dx, dy in CENTER_OFFSETS:
+            x, y = center_x + dx, center_y + dy
+            if self.maze.is_valid_position(x, y):
+                self.player = Player(x, y)
                 break
-            else:
-                continue
-            break
         
         # Create adversaries (starting from level 2)
         self.adversaries = []
@@ -291,93 +405,140 @@ class Game:
         
         self.lasers = []
         self.explosions = []
+        
+        self._player_moved = False  # Set by handle_input, cleared by update
+        
+        # Player distance field for adversary pathfinding (built lazily)
+        self._dist_field = None
+        self._dist_origin = None
     
     def handle_input(self):
+        if self.state != PLAYING:
+            return
+        
         keys = pygame.key.get_pressed()
+        player = self.player
+        
+        # Player movement (continuous when holding keys)
+        if player.can_move():
+            for key, direction in MOVE_KEYS:
+                if keys[key]:
+                    # Reset movement cooldown if player moved
+                    if player.move_to_nearest_tunnel(direction, self.maze):
+                        player.move_cooldown = player.move_speed
+                        self._player_moved = True
+                    break
+        
+        # Gun rotation (continuous)
+        for key, direction in GUN_KEYS:
+            if keys[key]:
+                player.rotate_gun(direction)
+                break
         
-        if self.state == GameState.PLAYING:
-            # Player movement (continuous when holding keys)
-            if self.player.can_move():
-                moved = False
-                if keys[pygame.K_UP]:
-                    moved = self.player.move_to_nearest_tunnel(Direction.UP, self.maze)
-                elif keys[pygame.K_DOWN]:
-                    moved = self.player.move_to_nearest_tunnel(Direction.DOWN, self.maze)
-                elif keys[pygame.K_LEFT]:
-                    moved = self.player.move_to_nearest_tunnel(Direction.LEFT, self.maze)
-                elif keys[pygame.K_RIGHT]:
-                    moved = self.player.move_to_nearest_tunnel(Direction.RIGHT, self.maze)
-                
-                # Reset movement cooldown if player moved
-                if moved:
-                    self.player.move_cooldown = self.player.move_speed
-            
-            # Gun rotation (continuous)
-            if keys[pygame.K_a]:
-                self.player.rotate_gun(Direction.LEFT)
-            elif keys[pygame.K_d]:
-                self.player.rotate_gun(Direction.RIGHT)
-            elif keys[pygame.K_w]:
-                self.player.rotate_gun(Direction.UP)
-            elif keys[pygame.K_s]:
-                self.player.rotate_gun(Direction.DOWN)
-            
-            # Shooting (continuous)
-            if keys[pygame.K_SPACE]:
-                laser = self.player.shoot()
-                if laser:
-                    self.lasers.append(laser)
+        # Shooting (continuous)
+        if keys[pygame.K_SPACE]:
+            laser = player.shoot(self.maze)
+            if laser:
+                self.lasers.append(laser)
     
     def handle_key_press(self, key):
         """Handle single key press events (not used for movement anymore)"""
         pass
     
     def update(self):
-        if self.state == GameState.PLAYING:
+        if self.state == PLAYING:
             self.player.update()
             
-            # Update adversaries
-            for adversary in self.adversaries:
-                adversary.update(self.player, self.maze)
+            # Update adversaries (those due to move are stepped in one batch)
+            movers = [adversary for adversary in self.adversaries if adversary.update()]
+            if movers:
+                Adversary.move_towards_player(movers, self.player_dist_field())
             
             # Update lasers
-            for laser in self.lasers[:]:
-                laser.update(self.maze)
-                if not laser.active:
-                    self.lasers.remove(laser)
+            for laser in self.lasers:
+                laser.update()
             
-            # Update explosions
-            for explosion in self.explosions[:]:
-                if not explosion.update():
-                    self.explosions.remove(explosion)
+            # Update explosions (reverse pass so finished ones can be popped in place)
+            explosions = self.explosions
+            for i in range(len(explosions) - 1, -1, -1):
+                if not explosions[i].update():
+                    explosions.pop(i)
             
-            # Check laser-adversary collisions
-            for laser in self.lasers[:]:
-                for adversary in self.adversaries[:]:
-                    if (abs(laser.x - adversary.x) < 1 and 
-                        abs(laser.y - adversary.y) < 1):
-                        self.lasers.remove(laser)
-                        self.adversaries.remove(adversary)
+            # Check laser-adversary collisions (removals are deferred to the
+            # in-place reverse passes below). Adversaries are bucketed by
+            # cell so each laser only tests the cells it overlaps.
+            adversaries_by_cell = {}
+            for adversary in self.adversaries:
+                adversaries_by_cell.setdefault((adversary.x, adversary.y), []).append(adversary)
+            
+            dead_lasers = set()
+            dead_adversaries = set()
+            for laser in self.lasers:
+                if not laser.active or not adversaries_by_cell:
+                    continue
+                # A laser halfway between two cells overlaps both of them
+                cell_x, cell_y = int(laser.x), int(laser.y)
+                cells = [(cell_x, cell_y)]
+                if laser.x != cell_x:
+                    cells.append((cell_x + 1, cell_y))
+                if laser.y != cell_y:
+                    cells.append((cell_x, cell_y + 1))
+                
+                for cell in cells:
+                    bucket = adversaries_by_cell.get(cell)
+                    if bucket:
+                        adversary = bucket.pop(0)
+                        if not bucket:
+                            del adversaries_by_cell[cell]
+                        dead_lasers.add(id(laser))
+                        dead_adversaries.add(id(adversary))
                         self.explosions.append(Explosion(adversary.x, adversary.y))
                         self.score += 100
                         
                         # Spawn new adversary
                         if self.level > 1:
-                            self.spawn_new_adversary()
+                            new_adversary = self.spawn_new_adversary()
+                            if new_adversary:
+                                adversaries_by_cell.setdefault(
+                                    (new_adversary.x, new_adversary.y), []).append(new_adversary)
                         break
             
-            # Check player-adversary collisions
-            for adversary in self.adversaries:
-                if abs(self.player.x - adversary.x) + abs(self.player.y - adversary.y) <= 1:
-                    self.state = GameState.GAME_OVER
+            lasers = self.lasers
+            for i in range(len(lasers) - 1, -1, -1):
+                laser = lasers[i]
+                if not laser.active or id(laser) in dead_lasers:
+                    lasers.pop(i)
+            if dead_adversaries:
+                adversaries = self.adversaries
+                for i in range(len(adversaries) - 1, -1, -1):
+                    if id(adversaries[i]) in dead_adversaries:
+                        adversaries.pop(i)
             
-            # Check if player reached exit
-            if (self.player.x >= MAZE_WIDTH - 2 and 
-                self.player.y >= MAZE_HEIGHT - 2):
-                self.state = GameState.LEVEL_COMPLETE
-                self.score += 1000 * self.level
+            # Collisions and the exit can only change once something has
+            # moved, so skip the checks on the frames in between
+            if movers or self._player_moved:
+                self._player_moved = False
+                
+                # Check player-adversary collisions
+                for adversary in self.adversaries:
+                    if abs(self.player.x - adversary.x) + abs(self.player.y - adversary.y) <= 1:
+                        self.state = GAME_OVER
+                
+                # Check if player reached exit
+                if (self.player.x >= MAZE_WIDTH - 2 and 
+                    self.player.y >= MAZE_HEIGHT - 2):
+                    self.state = LEVEL_COMPLETE
+                    self.score += 1000 * self.level
+    
+    def player_dist_field(self) -> np.ndarray:
+        """Distance field to the player, recomputed only after the player moves"""
+        position = (self.player.x, self.player.y)
+        if position != self._dist_origin:
+            self._dist_field = self.maze.distance_field(*position)
+            self._dist_origin = position
+        return self._dist_field
     
-    def spawn_new_adversary(self):
+    def spawn_new_adversary(self) -> Optional[Adversary]:
         """Spawn a new adversary at maze entrance"""
         adversary_speed = 0.5 + (self.level - 2) * 0.2
         # Try to spawn near entrance
@@ -386,26 +547,43 @@ class Game:
             y = random.randint(1, 5)
             if (self.maze.is_valid_position(x, y) and 
                 abs(x - self.player.x) + abs(y - self.player.y) > 3):
-                self.adversaries.append(Adversary(x, y, adversary_speed))
-                break
+                adversary = Adversary(x, y, adversary_speed)
+                self.adversaries.append(adversary)
+                return adversary
+        return None
     
     def draw(self):
-        self.screen.fill(BLACK)
+        if self.state == PLAYING and self._drawn_state == PLAYING:
+            # Only sprites and UI text change during play: restore the
+            # background under last frame's rects and update just those
+            for rect in self._dirty_rects:
+                self.screen.blit(self.background, rect, rect)
+            dirty_rects = self.draw_game()
+            pygame.display.update(self._dirty_rects + dirty_rects)
+            self._dirty_rects = dirty_rects
+            return
+        
+        if self.state == self._drawn_state:
+            return  # Menu and overlay screens are static
         
-        if self.state == GameState.MENU:
+        if self.state == MENU:
+            self.screen.fill(BLACK)
             self.draw_menu()
-        elif self.state == GameState.PLAYING:
-            self.draw_game()
-        elif self.state == GameState.GAME_OVER:
-            self.draw_game_over()
-        elif self.state == GameState.LEVEL_COMPLETE:
-            self.draw_level_complete()
+        else:
+            self.screen.blit(self.background, (0, 0))
+            if self.state == PLAYING:
+                self._dirty_rects = self.draw_game()
+            elif self.state == GAME_OVER:
+                self.draw_game_over()
+            elif self.state == LEVEL_COMPLETE:
+                self.draw_level_complete()
         
         pygame.display.flip()
+        self._drawn_state = self.state
     
     def draw_menu(self):
-        title = self.font.render("MAZEMASTER", True, WHITE)
-        subtitle = self.small_font.render("Press SPACE to Start", True, GRAY)
+        title = render_text(self.font, "MAZEMASTER", WHITE)
+        subtitle = render_text(self.small_font, "Press SPACE to Start", GRAY)
         instructions = [
             "Arrow Keys: Hold to move continuously",
             "WASD Keys: Rotate gun (W=up, S=down, A=left, D=right)",
@@ -418,39 +596,13 @@ class Game:
         self.screen.blit(subtitle, (WINDOW_WIDTH // 2 - subtitle.get_width() // 2, 250))
         
         for i, instruction in enumerate(instructions):
-            text = self.small_font.render(instruction, True, WHITE)
+            text = render_text(self.small_font, instruction, WHITE)
             self.screen.blit(text, (WINDOW_WIDTH // 2 - text.get_width() // 2, 320 + i * 30))
     
-    def draw_game(self):
-        # Calculate maze offset to center it
-        maze_pixel_width = self.maze.width * CELL_SIZE
-        maze_pixel_height = self.maze.height * CELL_SIZE
-        offset_x = (WINDOW_WIDTH - maze_pixel_width) // 2
-        offset_y = 50  # Leave space for UI
-        
-        # Draw maze
-        for y in range(self.maze.height):
-            for x in range(self.maze.width):
-                rect = pygame.Rect(
-                    offset_x + x * CELL_SIZE,
-                    offset_y + y * CELL_SIZE,
-                    CELL_SIZE,
-                    CELL_SIZE
-                )
-                
-                if self.maze.is_wall(x, y):
-                    pygame.draw.rect(self.screen, WHITE, rect)
-                else:
-                    pygame.draw.rect(self.screen, DARK_GRAY, rect)
-        
-        # Draw exit
-        exit_rect = pygame.Rect(
-            offset_x + (MAZE_WIDTH - 2) * CELL_SIZE,
-            offset_y + (MAZE_HEIGHT - 2) * CELL_SIZE,
-            CELL_SIZE,
-            CELL_SIZE
-        )
-        pygame.draw.rect(self.screen, GREEN, exit_rect)
+    def draw_game(self) -> List[pygame.Rect]:
+        """Draw sprites and UI over the background; returns the rects drawn"""
+        offset_x, offset_y = self.maze_offset
+        screen = self.screen
         
         # Draw player with gun
         player_rect = pygame.Rect(
@@ -459,51 +611,58 @@ class Game:
             CELL_SIZE - 4,
             CELL_SIZE - 4
         )
-        pygame.draw.rect(self.screen, RED, player_rect)
+        dirty_rects = [screen.fill(RED, player_rect)]
         
         # Draw gun barrel
-        gun_dx, gun_dy = self.player.gun_direction.value
+        gun_dx, gun_dy = self.player.gun_direction
         gun_start_x = offset_x + self.player.x * CELL_SIZE + CELL_SIZE // 2
         gun_start_y = offset_y + self.player.y * CELL_SIZE + CELL_SIZE // 2
         gun_end_x = gun_start_x + gun_dx * (CELL_SIZE // 2 + 4)
         gun_end_y = gun_start_y + gun_dy * (CELL_SIZE // 2 + 4)
         
-        pygame.draw.line(self.screen, WHITE, 
-                        (gun_start_x, gun_start_y), 
-                        (gun_end_x, gun_end_y), 3)
+        dirty_rects.append(pygame.draw.line(screen, WHITE, 
+                                            (gun_start_x, gun_start_y), 
+                                            (gun_end_x, gun_end_y), 3))
+        
+        # Adversaries and lasers are plain rects: queue them by colour and
+        # fill each colour in one contiguous run
+        fills = self._frame_fills
+        fills.clear()
         
         # Draw adversaries
+        adversary_rects = fills[ORANGE]
         for adversary in self.adversaries:
-            adv_rect = pygame.Rect(
+            adversary_rects.append((
                 offset_x + adversary.x * CELL_SIZE + 2,
                 offset_y + adversary.y * CELL_SIZE + 2,
                 CELL_SIZE - 4,
                 CELL_SIZE - 4
-            )
-            pygame.draw.rect(self.screen, ORANGE, adv_rect)
+            ))
         
         # Draw lasers with trail effect
+        laser_rects = fills[YELLOW]
         for laser in self.lasers:
-            # Draw trail
-            for i, (trail_x, trail_y) in enumerate(laser.trail):
-                alpha = int(255 * (i + 1) / len(laser.trail))
-                trail_color = (*YELLOW[:3], alpha) if len(YELLOW) == 4 else YELLOW
-                trail_rect = pygame.Rect(
+            # Trail
+            for trail_x, trail_y in laser.trail():
+                laser_rects.append((
                     offset_x + trail_x * CELL_SIZE + CELL_SIZE // 2 - 1,
                     offset_y + trail_y * CELL_SIZE + CELL_SIZE // 2 - 1,
                     2,
                     2
-                )
-                pygame.draw.rect(self.screen, trail_color, trail_rect)
+                ))
             
-            # Draw main laser
-            laser_rect = pygame.Rect(
+            # Main laser
+            laser_rects.append((
                 offset_x + int(laser.x) * CELL_SIZE + CELL_SIZE // 2 - 2,
                 offset_y + int(laser.y) * CELL_SIZE + CELL_SIZE // 2 - 2,
                 4,
                 4
-            )
-            pygame.draw.rect(self.screen, YELLOW, laser_rect)
+            ))
+        
+        fill = screen.fill
+        for color, rects in fills.items():
+            for rect in rects:
+                dirty_rects.append(fill(color, rect))
         
         # Draw explosions
         for explosion in self.explosions:
@@ -517,33 +676,31 @@ class Game:
                 for i, color in enumerate(colors):
                     exp_radius = max(1, radius - i * 2)
                     if exp_radius > 0:
-                        pygame.draw.circle(self.screen, color, 
-                                         (explosion_center_x, explosion_center_y), 
-                                         exp_radius)
+                        dirty_rects.append(pygame.draw.circle(screen, color, 
+                                                              (explosion_center_x, explosion_center_y), 
+                                                              exp_radius))
         
         # Draw UI
-        level_text = self.small_font.render(f"Level: {self.level}", True, WHITE)
-        score_text = self.small_font.render(f"Score: {self.score}", True, WHITE)
-        enemies_text = self.small_font.render(f"Enemies: {len(self.adversaries)}", True, WHITE)
-        ammo_text = self.small_font.render(f"Gun: {'Ready' if self.player.shoot_cooldown == 0 else 'Reloading'}", True, WHITE)
-        
-        self.screen.blit(level_text, (10, 10))
-        self.screen.blit(score_text, (10, 30))
-        self.screen.blit(enemies_text, (WINDOW_WIDTH - 120, 10))
-        self.screen.blit(ammo_text, (WINDOW_WIDTH - 120, 30))
+        level_text = render_text(self.small_font, f"Level: {self.level}", WHITE)
+        score_text = render_text(self.small_font, f"Score: {self.score}", WHITE)
+        enemies_text = render_text(self.small_font, f"Enemies: {len(self.adversaries)}", WHITE)
+        ammo_text = render_text(self.small_font, f"Gun: {'Ready' if self.player.shoot_cooldown == 0 else 'Reloading'}", WHITE)
+        
+        dirty_rects.append(screen.blit(level_text, (10, 10)))
+        dirty_rects.append(screen.blit(score_text, (10, 30)))
+        dirty_rects.append(screen.blit(enemies_text, (WINDOW_WIDTH - 120, 10)))
+        dirty_rects.append(screen.blit(ammo_text, (WINDOW_WIDTH - 120, 30)))
+        return dirty_rects
     
     def draw_game_over(self):
         self.draw_game()  # Draw game state behind
         
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
         
-        game_over_text = self.font.render("GAME OVER", True, RED)
-        score_text = self.small_font.render(f"Final Score: {self.score}", True, WHITE)
-        restart_text = self.small_font.render("Press R to Restart or ESC to Menu", True, GRAY)
+        game_over_text = render_text(self.font, "GAME OVER", RED)
+        score_text = render_text(self.small_font, f"Final Score: {self.score}", WHITE)
+        restart_text = render_text(self.small_font, "Press R to Restart or ESC to Menu", GRAY)
         
         self.screen.blit(game_over_text, (WINDOW_WIDTH // 2 - game_over_text.get_width() // 2, 250))
         self.screen.blit(score_text, (WINDOW_WIDTH // 2 - score_text.get_width() // 2, 300))
@@ -553,14 +710,11 @@ class Game:
         self.draw_game()  # Draw game state behind
         
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
         
-        complete_text = self.font.render("LEVEL COMPLETE!", True, GREEN)
-        score_text = self.small_font.render(f"Score: {self.score}", True, WHITE)
-        next_text = self.small_font.render("Press SPACE for Next Level", True, GRAY)
+        complete_text = render_text(self.font, "LEVEL COMPLETE!", GREEN)
+        score_text = render_text(self.small_font, f"Score: {self.score}", WHITE)
+        next_text = render_text(self.small_font, "Press SPACE for Next Level", GRAY)
         
         self.screen.blit(complete_text, (WINDOW_WIDTH // 2 - complete_text.get_width() // 2, 250))
         self.screen.blit(score_text, (WINDOW_WIDTH // 2 - score_text.get_width() // 2, 300))
@@ -574,27 +728,30 @@ class Game:
                 if event.type == pygame.QUIT:
                     running = False
                 
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self._drawn_state = None  # Window contents lost; redraw fully
+                
                 elif event.type == pygame.KEYDOWN:
-                    if self.state == GameState.MENU:
+                    if self.state == MENU:
                         if event.key == pygame.K_SPACE:
-                            self.state = GameState.PLAYING
+                            self.state = PLAYING
                     
-                    elif self.state == GameState.GAME_OVER:
+                    elif self.state == GAME_OVER:
                         if event.key == pygame.K_r:
                             self.level = 1
                             self.score = 0
                             self.reset_level()
-                            self.state = GameState.PLAYING
+                            self.state = PLAYING
                         elif event.key == pygame.K_ESCAPE:
-                            self.state = GameState.MENU
+                            self.state = MENU
                     
-                    elif self.state == GameState.LEVEL_COMPLETE:
+                    elif self.state == LEVEL_COMPLETE:
                         if event.key == pygame.K_SPACE:
                             self.level += 1
                             self.reset_level()
-                            self.state = GameState.PLAYING
+                            self.state = PLAYING
                         elif event.key == pygame.K_ESCAPE:
-                            self.state = GameState.MENU
+                            self.state = MENU
                     
                     # Handle movement key presses (no longer needed)
                     # self.handle_key_press(event.key)